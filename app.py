@@ -9,6 +9,7 @@ from utils.data_loader import DataLoader
 from utils.filters import FilterManager
 from utils.visualizations import VisualizationManager
 from utils.statistics import StatisticsManager
+from utils.warmup import get_artifact_cache, get_warmup_manager
 
 
 def main():
@@ -47,15 +48,25 @@ def main():
     st.sidebar.metric("Total Records", len(df))
     st.sidebar.metric("Filtered Records", len(filtered_df))
     
+    # Report warm-up readiness when the server was started with it
+    warmup_manager = get_warmup_manager()
+    if warmup_manager.state != "idle":
+        st.sidebar.caption(warmup_manager.status())
+    
+    # Reuse figures and aggregates already built for this selection
+    artifacts = None
+    if dataset_type == "netflix":
+        artifacts = get_artifact_cache().get(data_loader.version, filter_manager.selection_key())
+    
     # Display summary metrics
-    stats_manager = StatisticsManager(filtered_df, dataset_type)
+    stats_manager = StatisticsManager(filtered_df, dataset_type, artifacts)
     stats_manager.display_top_metrics()
     
     st.markdown("---")
     
     # Display visualizations
     st.header("📈 Data Visualizations")
-    viz_manager = VisualizationManager(filtered_df, dataset_type)
+    viz_manager = VisualizationManager(filtered_df, dataset_type, artifacts)
     viz_manager.display_visualizations()
     
     # Display data summary
@@ -0,0 +1,309 @@
+"""
+Load test driving the real app.py through Streamlit's AppTest
+
+Simulates concurrent viewer sessions that randomly change the sidebar
+filters and rerun the app, then reports rerun latency percentiles,
+throughput and memory use.
+
+Usage:
+    python load_test.py --sessions 20 --reruns 30
+    python load_test.py --sessions 8 --processes   # one process per session
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import threading
+import time
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(APP_DIR, "app.py")
+
+TYPE_LABEL = "Select Content Type:"
+RATING_LABEL = "Select Rating:"
+YEAR_LABEL = "Release Year Range:"
+
+
+def current_rss():
+    """
+    Resident set size of this process in bytes
+
+    Reads /proc on Linux and falls back to the peak RSS elsewhere.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _widget(widgets, label):
+    """Find a widget by its label, or None"""
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    return None
+
+
+def random_interaction(at, rng):
+    """
+    Change one sidebar filter at random, the way a viewer would
+
+    Args:
+        at (AppTest): Session that already ran once
+        rng (random.Random): Source of randomness for this session
+    """
+    action = rng.choice(["types", "ratings", "years", "reset"])
+
+    if action in ("types", "ratings"):
+        widget = _widget(at.multiselect, TYPE_LABEL if action == "types" else RATING_LABEL)
+        if widget is not None and widget.options:
+            widget.set_value(rng.sample(widget.options, rng.randint(1, len(widget.options))))
+    elif action == "years":
+        widget = _widget(at.slider, YEAR_LABEL)
+        if widget is not None:
+            low = rng.randint(widget.min, widget.max)
+            widget.set_range(low, rng.randint(low, widget.max))
+    else:
+        # Back to the default view: everything selected, full year range
+        for label in (TYPE_LABEL, RATING_LABEL):
+            widget = _widget(at.multiselect, label)
+            if widget is not None:
+                widget.set_value(list(widget.options))
+        widget = _widget(at.slider, YEAR_LABEL)
+        if widget is not None:
+            widget.set_range(widget.min, widget.max)
+
+
+def run_session(session_id, reruns, seed, timeout):
+    """
+    Run one simulated session
+
+    Args:
+        session_id (int): Index of the session, mixed into the seed
+        reruns (int): Filter interactions after the initial page load
+        seed (int): Base random seed
+        timeout (float): Seconds allowed per rerun
+
+    Returns:
+        dict: Rerun latencies in seconds, error count and the RSS growth
+            of this process over the session, in bytes
+    """
+    rng = random.Random(seed + session_id)
+    rss_before = current_rss()
+    latencies = []
+    errors = 0
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    for i in range(reruns + 1):
+        if i > 0:
+            random_interaction(at, rng)
+        start = time.perf_counter()
+        try:
+            at.run()
+        except Exception:
+            errors += 1
+            continue
+        latencies.append(time.perf_counter() - start)
+        if at.exception:
+            errors += 1
+
+    return {
+        "latencies": latencies,
+        "errors": errors,
+        "rss_growth": current_rss() - rss_before,
+    }
+
+
+def preload_app():
+    """
+    Import the app's libraries and load the dataset
+
+    Done before RSS baselines are taken, so that per-session growth covers
+    only what sessions add on top of a running server.
+    """
+    os.chdir(APP_DIR)
+    from utils.data_loader import find_dataset_path
+    from utils.data_store import get_data_store
+    path = find_dataset_path()
+    if path is not None:
+        get_data_store(path)
+
+
+def _init_worker():
+    """Pool initializer: preload so the session's RSS growth excludes startup"""
+    preload_app()
+
+
+def _run_session_star(args):
+    """Pool.map adapter for run_session"""
+    return run_session(*args)
+
+
+def run_threads(sessions, reruns, seed, timeout):
+    """
+    Run all sessions concurrently in this process, as a single server would
+
+    Returns:
+        tuple: (session results, peak RSS in bytes)
+    """
+    results = [None] * sessions
+    peak = [current_rss()]
+    done = threading.Event()
+
+    def sample_rss():
+        while not done.wait(0.1):
+            peak[0] = max(peak[0], current_rss())
+
+    def worker(session_id):
+        results[session_id] = run_session(session_id, reruns, seed, timeout)
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    sampler.join()
+
+    return results, max(peak[0], current_rss())
+
+
+def run_processes(sessions, reruns, seed, timeout):
+    """
+    Run each session in its own process to measure each session's RSS
+
+    A session's RSS is how much its process grew after the app's libraries
+    were imported and the dataset loaded, the same starting point as threads
+    mode. Sessions do not share figure caches in this mode, so it measures
+    the cost of an isolated session rather than the capacity of one server.
+
+    Returns:
+        list: Session results
+    """
+    jobs = [(i, reruns, seed, timeout) for i in range(sessions)]
+    with multiprocessing.get_context("spawn").Pool(sessions, initializer=_init_worker) as pool:
+        return pool.map(_run_session_star, jobs)
+
+
+def summarize(results, wall_time, mode, baseline_rss=None, peak_rss=None):
+    """
+    Aggregate session results into the report
+
+    Args:
+        results (list): Session results
+        wall_time (float): Seconds the whole run took
+        mode (str): "threads" or "processes"
+        baseline_rss (int): Process RSS before the sessions started (threads mode)
+        peak_rss (int): Peak process RSS during the run (threads mode)
+
+    Returns:
+        dict: Latency percentiles in ms, throughput, error count and RSS in MB
+    """
+    latencies = np.array([latency for result in results for latency in result["latencies"]])
+    sessions = len(results)
+
+    if mode == "threads":
+        # Sessions share one process, so only the average growth is measurable
+        rss = {
+            "baseline": baseline_rss / 2**20,
+            "peak": peak_rss / 2**20,
+            "growth_per_session_avg": (peak_rss - baseline_rss) / sessions / 2**20,
+        }
+    else:
+        growth = [result["rss_growth"] for result in results]
+        rss = {
+            "growth_per_session_mean": float(np.mean(growth)) / 2**20,
+            "growth_per_session_max": float(np.max(growth)) / 2**20,
+        }
+
+    return {
+        "mode": mode,
+        "sessions": sessions,
+        "reruns": int(latencies.size),
+        "errors": sum(result["errors"] for result in results),
+        "wall_time_s": wall_time,
+        "throughput_rps": latencies.size / wall_time if wall_time else 0.0,
+        "latency_ms": {
+            "p50": float(np.percentile(latencies, 50) * 1000) if latencies.size else None,
+            "p95": float(np.percentile(latencies, 95) * 1000) if latencies.size else None,
+            "p99": float(np.percentile(latencies, 99) * 1000) if latencies.size else None,
+            "max": float(latencies.max() * 1000) if latencies.size else None,
+        },
+        "rss_mb": rss,
+    }
+
+
+def print_report(report):
+    """Print the report as a readable table"""
+    latency = report["latency_ms"]
+    rss = report["rss_mb"]
+    print(f"Sessions:          {report['sessions']} ({report['mode']})")
+    print(f"Reruns:            {report['reruns']} ({report['errors']} errors)")
+    print(f"Wall time:         {report['wall_time_s']:.1f} s")
+    print(f"Throughput:        {report['throughput_rps']:.2f} reruns/s")
+    if latency["p50"] is not None:
+        print(f"Latency p50/p95/p99/max: "
+              f"{latency['p50']:.0f} / {latency['p95']:.0f} / {latency['p99']:.0f} / {latency['max']:.0f} ms")
+    if report["mode"] == "threads":
+        print(f"RSS baseline:      {rss['baseline']:.0f} MB")
+        print(f"RSS peak (total):  {rss['peak']:.0f} MB")
+        print(f"RSS growth per session: {rss['growth_per_session_avg']:.1f} MB average")
+    else:
+        print(f"RSS growth per session: {rss['growth_per_session_mean']:.1f} MB mean, "
+              f"{rss['growth_per_session_max']:.1f} MB max")
+
+
+def main():
+    """Parse arguments, run the load test and report"""
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent simulated sessions")
+    parser.add_argument("--reruns", type=int, default=20, help="filter interactions per session")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds allowed per rerun")
+    parser.add_argument("--processes", action="store_true",
+                        help="run each session in its own process to measure per-session RSS growth")
+    parser.add_argument("--warmup", action="store_true",
+                        help="run the cache warm-up first, as serve.py does (threads mode only)")
+    parser.add_argument("--json", metavar="PATH", help="also write the report to a JSON file")
+    args = parser.parse_args()
+
+    # Imports and the dataset load are server startup, not session cost
+    preload_app()
+
+    if args.warmup and not args.processes:
+        from utils.warmup import get_warmup_manager
+        manager = get_warmup_manager()
+        manager.start()
+        manager.wait()
+        print(manager.status())
+
+    start = time.perf_counter()
+    if args.processes:
+        results = run_processes(args.sessions, args.reruns, args.seed, args.timeout)
+        report = summarize(results, time.perf_counter() - start, "processes")
+    else:
+        baseline_rss = current_rss()
+        results, peak_rss = run_threads(args.sessions, args.reruns, args.seed, args.timeout)
+        report = summarize(results, time.perf_counter() - start, "threads", baseline_rss, peak_rss)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
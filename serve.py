@@ -0,0 +1,26 @@
+"""
+Start the Streamlit server with the optional warm-up phase
+
+Usage:
+    python serve.py [streamlit run options]
+"""
+
+import os
+import sys
+
+from streamlit.web import cli as stcli
+from utils.warmup import get_warmup_manager
+
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def main():
+    """Kick off the warm-up in the background, then hand over to `streamlit run`"""
+    get_warmup_manager().start()
+    sys.argv = ["streamlit", "run", APP_PATH, *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()
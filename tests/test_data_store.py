@@ -0,0 +1,87 @@
+"""
+Tests for the incremental dataset store
+"""
+
+import gc
+import os
+import shutil
+
+import pandas as pd
+
+from utils.data_store import DataStore, DatasetWatcher, KEY_COLUMN, split_records
+
+
+DATASET = os.path.join(os.path.dirname(__file__), os.pardir, 'data', 'netflix_titles.csv')
+
+
+def _edit(path, edit):
+    """Rewrite the dataset through edit(lines) and bump its mtime"""
+    lines = path.read_text(encoding='utf-8').split('\n')
+    edit(lines)
+    path.write_text('\n'.join(lines), encoding='utf-8')
+    os.utime(path, ns=(os.stat(path).st_mtime_ns + 1,) * 2)
+
+
+def _copy_dataset(tmp_path):
+    path = tmp_path / 'netflix_titles.csv'
+    shutil.copy(DATASET, path)
+    return path
+
+
+def test_refresh_matches_full_reload(tmp_path):
+    path = _copy_dataset(tmp_path)
+    store = DataStore(str(path))
+
+    def edit(lines):
+        # Changed row
+        lines[1] = lines[1].replace('Dick Johnson Is Dead', 'Dick Johnson Lives')
+        # New rows in the middle of the file, the first with a leading-space date
+        lines.insert(2, 's0,Movie,New One,,,India," August 4, 2017",2017,PG,90 min,Dramas,desc')
+        lines.insert(3, 's99999,TV Show,Newer One,,,India,"October 1, 2026",2026,TV-MA,1 Season,Dramas,desc')
+
+    _edit(path, edit)
+    assert store.refresh() == 3
+
+    refreshed, count, version = store.snapshot()
+    fresh, fresh_count, _ = DataStore(str(path)).snapshot()
+    assert version == 1
+    assert count == fresh_count == len(pd.read_csv(path))
+    # Same rows in the same order, not just the same set
+    pd.testing.assert_frame_equal(refreshed, fresh)
+    assert refreshed[KEY_COLUMN].head(4).tolist() == ['s1', 's0', 's99999', 's2']
+
+    rows = refreshed.set_index(KEY_COLUMN)
+    assert rows.loc['s1', 'title'] == 'Dick Johnson Lives'
+    assert rows.loc['s0', 'date_added'] == pd.Timestamp('2017-08-04')
+    assert rows.loc['s99999', 'date_added'] == pd.Timestamp('2026-10-01')
+
+
+def test_refresh_without_changes(tmp_path):
+    path = _copy_dataset(tmp_path)
+    store = DataStore(str(path))
+    _edit(path, lambda lines: None)
+    assert store.refresh() == 0
+    assert store.snapshot()[2] == 0
+
+
+def test_split_records_keeps_multiline_fields():
+    header, records = split_records(b'id,text\n1,"a\nb"\n\n2,c\n')
+    assert header == b'id,text'
+    assert records == [b'1,"a\nb"', b'2,c']
+
+
+def test_leading_space_dates_are_parsed():
+    df, count, _ = DataStore(DATASET).snapshot()
+    raw = pd.read_csv(DATASET, dtype=str)
+    assert count == len(raw)
+    assert df['date_added'].notna().sum() == raw['date_added'].notna().sum()
+
+
+def test_watcher_stops_when_store_is_dropped():
+    store = DataStore(DATASET)
+    watcher = DatasetWatcher(store, interval=60)
+    watcher.start()
+    del store
+    gc.collect()
+    watcher.join(timeout=5)
+    assert not watcher.is_alive()
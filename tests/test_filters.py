@@ -0,0 +1,69 @@
+"""
+Tests for the pure filter helpers used by the warm-up cache
+"""
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+from utils.data_store import DataStore
+from utils.filters import filter_netflix, default_netflix_selection, selection_key
+
+
+DATASET = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, 'data', 'netflix_titles.csv'))
+
+
+def _chained_filter(df, types, ratings, year_range):
+    """The filtering FilterManager did before filter_netflix existed"""
+    filtered_df = df.copy()
+    filtered_df = filtered_df[filtered_df['type'].isin(types)]
+    filtered_df = filtered_df[filtered_df['rating'].isin(ratings)]
+    return filtered_df[
+        (filtered_df['release_year'] >= year_range[0]) &
+        (filtered_df['release_year'] <= year_range[1])
+    ]
+
+
+def _widget_default_key(path):
+    """Run FilterManager with untouched widgets and return its selection key"""
+    def script():
+        import streamlit as st
+        from utils.data_store import DataStore
+        from utils.filters import FilterManager
+
+        df, _, _ = DataStore(st.session_state['path']).snapshot()
+        filter_manager = FilterManager(df, "netflix")
+        filter_manager.apply_filters()
+        st.session_state['key'] = filter_manager.selection_key()
+
+    at = AppTest.from_function(script, default_timeout=30)
+    at.session_state['path'] = path
+    at.run()
+    assert not at.exception
+    return at.session_state['key']
+
+
+def test_default_key_matches_widget_defaults():
+    df, _, _ = DataStore(DATASET).snapshot()
+    assert selection_key(default_netflix_selection(df)) == _widget_default_key(DATASET)
+
+
+def test_filter_netflix_matches_chained_filtering():
+    df, _, _ = DataStore(DATASET).snapshot()
+    default = default_netflix_selection(df)
+    selections = [
+        default,
+        {**default, 'types': ['Movie']},
+        {**default, 'ratings': ['PG', 'TV-MA', 'R']},
+        {**default, 'year_range': (1990, 2005)},
+        {'types': ['TV Show'], 'ratings': ['TV-14'], 'year_range': (2015, 2021)},
+    ]
+    for selection in selections:
+        expected = _chained_filter(df, selection['types'], selection['ratings'], selection['year_range'])
+        assert filter_netflix(df, selection).equals(expected)
+
+
+def test_selection_key_ignores_order():
+    first = {'types': ['Movie', 'TV Show'], 'ratings': ['R', 'PG'], 'year_range': (2000, 2010)}
+    second = {'types': ['TV Show', 'Movie'], 'ratings': ['PG', 'R'], 'year_range': [2000, 2010]}
+    assert selection_key(first) == selection_key(second)
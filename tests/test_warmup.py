@@ -0,0 +1,63 @@
+"""
+Tests for the warm-up phase and the artifact cache
+"""
+
+import os
+import shutil
+import time
+
+from utils.data_store import DataStore
+from utils.filters import default_netflix_selection, selection_key
+from utils.warmup import ArtifactCache, WarmupManager
+
+
+DATASET = os.path.join(os.path.dirname(__file__), os.pardir, 'data', 'netflix_titles.csv')
+
+
+def test_new_snapshot_is_warmed_again(tmp_path):
+    path = tmp_path / 'netflix_titles.csv'
+    shutil.copy(DATASET, path)
+    store = DataStore(str(path))
+    cache = ArtifactCache()
+    manager = WarmupManager(cache, selections=[{'types': ['Movie']}], max_workers=2)
+    store.add_listener(manager._on_snapshot)
+    manager._warm(store.snapshot())
+    assert manager.is_ready()
+    assert len(cache._entries) == 2
+
+    text = path.read_text(encoding='utf-8')
+    path.write_text(text.replace('Dick Johnson Is Dead', 'Dick Johnson Lives'), encoding='utf-8')
+    os.utime(path, ns=(os.stat(path).st_mtime_ns + 1,) * 2)
+    store.refresh()
+
+    deadline = time.monotonic() + 30
+    while not (manager.is_ready() and cache.version == 1) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    df, _, version = store.snapshot()
+    key = selection_key(default_netflix_selection(df))
+    # Old-version entries are gone and the new default selection is complete
+    assert [entry_version for entry_version, _ in cache._entries] == [1, 1]
+    assert 'csv' in cache.get(version, key)
+    assert 'Dick Johnson Lives' in cache.get(version, key)['csv']
+
+
+def test_artifact_cache_evicts_least_recently_used():
+    cache = ArtifactCache(max_entries=2)
+    first = cache.get(0, 'a')
+    cache.get(0, 'b')
+    assert cache.get(0, 'a') is first
+    cache.get(0, 'c')
+    assert list(cache._entries) == [(0, 'a'), (0, 'c')]
+    assert cache.get(0, 'a') is first
+
+
+def test_artifact_cache_drops_older_versions():
+    cache = ArtifactCache()
+    stale = cache.get(0, 'a')
+    current = cache.get(1, 'a')
+    assert current is not stale
+    assert list(cache._entries) == [(1, 'a')]
+    # Sessions still on the old snapshot get a throwaway dict
+    assert cache.get(0, 'a') is not stale
+    assert list(cache._entries) == [(1, 'a')]
@@ -4,15 +4,24 @@ Utils package for modular Streamlit application components
 
 from .config import configure_page, apply_custom_styling
 from .data_loader import DataLoader
+from .data_store import DataStore, DatasetWatcher, get_data_store
 from .filters import FilterManager
 from .visualizations import VisualizationManager
 from .statistics import StatisticsManager
+from .warmup import ArtifactCache, WarmupManager, get_artifact_cache, get_warmup_manager
 
 __all__ = [
     'configure_page',
     'apply_custom_styling',
     'DataLoader',
+    'DataStore',
+    'DatasetWatcher',
+    'get_data_store',
     'FilterManager',
     'VisualizationManager',
-    'StatisticsManager'
+    'StatisticsManager',
+    'ArtifactCache',
+    'WarmupManager',
+    'get_artifact_cache',
+    'get_warmup_manager'
 ]
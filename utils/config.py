@@ -5,6 +5,22 @@ Configuration module for page settings and custom styling
 import streamlit as st
 
 
+# Filter selections prebuilt by the warm-up phase, on top of the default
+# (all types, all ratings, full year range). Missing keys keep their default.
+WARMUP_SELECTIONS = [
+    {'types': ['Movie']},
+    {'types': ['TV Show']},
+]
+
+# Threads used by the warm-up phase
+WARMUP_WORKERS = 4
+
+# Filter selections whose figures and aggregates are kept in memory. Each entry
+# costs about 0.7 MB for the full dataset; warmed selections also keep their
+# CSV export (about 3.3 MB unfiltered). With the defaults the cache peaks near 30 MB.
+ARTIFACT_CACHE_SIZE = 32
+
+
 def configure_page():
     """Configure Streamlit page settings"""
     st.set_page_config(
@@ -3,15 +3,34 @@ Data loading module for handling Kaggle dataset
 """
 
 import streamlit as st
-import pandas as pd
 import os
+from .data_store import get_data_store
+
+
+# Locations searched for the dataset, in order
+DATASET_PATHS = [
+    '/mnt/user-data/uploads/netflix_titles.csv',  # Uploaded file location
+    'netflix_titles.csv',
+    'data/netflix_titles.csv',
+    '../netflix_titles.csv',
+    './netflix_titles.csv'
+]
+
+
+def find_dataset_path():
+    """Return the first existing dataset location, or None"""
+    for path in DATASET_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
 
 
 class DataLoader:
     """Handles loading Netflix dataset from Kaggle"""
     
     def __init__(self):
-        pass
+        # Snapshot version of the loaded data, bumped on every delta ingestion
+        self.version = None
     
     def load_data(self):
         """
@@ -27,27 +46,11 @@ class DataLoader:
         return self._load_netflix_dataset()
     
     def _load_netflix_dataset(self):
-        """Load Netflix dataset from uploaded CSV file"""
+        """Load Netflix dataset from the shared, incrementally refreshed store"""
         try:
-            # Try to find the dataset in common locations
-            possible_paths = [
-                '/mnt/user-data/uploads/netflix_titles.csv',  # Uploaded file location
-                'netflix_titles.csv',
-                'data/netflix_titles.csv',
-                '../netflix_titles.csv',
-                './netflix_titles.csv'
-            ]
+            found_path = find_dataset_path()
             
-            df = None
-            found_path = None
-            
-            for path in possible_paths:
-                if os.path.exists(path):
-                    df = pd.read_csv(path)
-                    found_path = path
-                    break
-            
-            if df is None:
+            if found_path is None:
                 st.error("❌ Netflix dataset not found!")
                 st.info("""
                 📥 **How to get the dataset:**
@@ -59,17 +62,8 @@ class DataLoader:
                 """)
                 return None, None, None
             
-            # Clean the data
-            if 'date_added' in df.columns:
-                df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
-                df['year_added'] = df['date_added'].dt.year
-            
-            if 'release_year' in df.columns:
-                df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
-            
-            # Remove rows with missing critical data
-            original_count = len(df)
-            df = df.dropna(subset=['type', 'title'])
+            # Grab the snapshot once so the whole rerun sees a consistent dataset
+            df, original_count, self.version = get_data_store(found_path).snapshot()
             
             info = f"Netflix Movies & TV Shows dataset from Kaggle - Contains {len(df):,} titles (originally {original_count:,} records)"
             return df, info, "netflix"
@@ -0,0 +1,265 @@
+"""
+Shared dataset store with incremental (delta) ingestion and file watching
+"""
+
+import io
+import logging
+import os
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+logger = logging.getLogger(__name__)
+
+# Column used to match rows between two exports of the dataset
+KEY_COLUMN = 'show_id'
+
+# Format of date_added in the Kaggle export, e.g. "September 25, 2021"
+DATE_ADDED_FORMAT = '%B %d, %Y'
+
+def clean_netflix_rows(raw):
+    """
+    Turn raw CSV rows into the cleaned frame the dashboard works with
+
+    Args:
+        raw (DataFrame): Rows as read from the CSV file
+
+    Returns:
+        DataFrame: Cleaned rows
+    """
+    df = raw.copy()
+
+    if 'date_added' in df.columns:
+        # Explicit format: inferring it from the first row of each batch would
+        # make a delta batch parse differently from a full load
+        df['date_added'] = pd.to_datetime(
+            df['date_added'].str.strip(), format=DATE_ADDED_FORMAT, errors='coerce'
+        )
+        df['year_added'] = df['date_added'].dt.year
+
+    if 'release_year' in df.columns:
+        df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
+
+    # Remove rows with missing critical data
+    return df.dropna(subset=['type', 'title'])
+
+
+def split_records(data):
+    """
+    Split raw CSV bytes into the header and one bytes string per record
+
+    Newlines inside quoted fields do not end a record, and blank lines are
+    skipped, as pd.read_csv does.
+
+    Args:
+        data (bytes): Contents of the CSV file
+
+    Returns:
+        tuple: (header, list of records)
+    """
+    records = []
+    pending = None
+    for line in data.split(b'\n'):
+        if pending is not None:
+            pending += b'\n' + line
+            if line.count(b'"') % 2:
+                records.append(pending)
+                pending = None
+        elif line.count(b'"') % 2:
+            pending = line
+        elif line.strip():
+            records.append(line)
+    if pending is not None:
+        records.append(pending)
+
+    if not records:
+        raise ValueError("Dataset file is empty")
+    return records[0], records[1:]
+
+
+def _index_records(records):
+    """Map show_id to its record, keeping the last duplicate in its position"""
+    by_id = {}
+    for record in records:
+        key = record.split(b',', 1)[0].strip(b'"\r').decode('utf-8')
+        by_id.pop(key, None)
+        by_id[key] = record
+    return by_id
+
+
+def _parse(data):
+    """Parse CSV bytes as untyped strings, keeping the last row per show_id"""
+    raw = pd.read_csv(io.BytesIO(data), dtype=str)
+    return raw.drop_duplicates(subset=[KEY_COLUMN], keep='last')
+
+
+class DataStore:
+    """Holds the current dataset snapshot and upserts changed rows into it"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._header = None
+        # show_id -> raw record bytes, used to find changed rows without parsing
+        self._records = None
+        self._signature = None
+        # (dataframe, row_count, version) - replaced as a whole, never mutated
+        self._snapshot = None
+        self._listeners = []
+        self.reload()
+
+    def snapshot(self):
+        """
+        Return the current snapshot
+
+        The tuple is swapped atomically on every update, so a session that
+        grabbed it at the start of a rerun keeps a consistent view until the
+        rerun finishes.
+
+        Returns:
+            tuple: (dataframe, rows in the file as read, version)
+        """
+        return self._snapshot
+
+    def add_listener(self, callback):
+        """
+        Call callback(snapshot) after every newly published snapshot
+
+        Callbacks run on the thread that published, while the store is locked,
+        so they should only hand the work off.
+        """
+        self._listeners.append(callback)
+
+    def reload(self):
+        """Fully re-read and re-clean the dataset"""
+        with self._lock:
+            signature = self._file_signature()
+            data = self._read_file()
+            header, records = split_records(data)
+            df = clean_netflix_rows(_parse(data)).reset_index(drop=True)
+            self._publish(header, _index_records(records), df, len(records), signature)
+
+    def refresh(self):
+        """
+        Ingest new or changed rows from the dataset file
+
+        Rows are matched on ``show_id``. The file is split into raw records
+        and compared byte for byte with the previous export, so only new or
+        changed records are parsed and cleaned. The result has the same rows
+        in the same order as a full reload, except that rows which
+        disappeared from the file are kept, at the end.
+
+        Returns:
+            int: Number of rows that were inserted or updated
+        """
+        with self._lock:
+            signature = self._file_signature()
+            if signature == self._signature:
+                return 0
+
+            data = self._read_file()
+            header, records = split_records(data)
+            if header != self._header:
+                # Schema changed - nothing to diff against
+                df = clean_netflix_rows(_parse(data)).reset_index(drop=True)
+                self._publish(header, _index_records(records), df, len(records), signature)
+                return len(records)
+
+            by_id = _index_records(records)
+            delta_ids = [key for key, record in by_id.items() if self._records.get(key) != record]
+
+            if not delta_ids:
+                self._signature = signature
+                return 0
+
+            delta = clean_netflix_rows(_parse(header + b'\n' + b'\n'.join(by_id[key] for key in delta_ids)))
+            current = self._snapshot[0]
+            kept = current[~current[KEY_COLUMN].isin(delta_ids)]
+            combined = pd.concat([kept, delta[current.columns]], ignore_index=True)
+
+            # Put rows back in file order, as a full reload would
+            position = pd.Index(list(by_id)).get_indexer(combined[KEY_COLUMN])
+            position[position < 0] = len(by_id)
+            df = combined.iloc[np.argsort(position, kind='stable')].reset_index(drop=True)
+
+            self._publish(header, {**self._records, **by_id}, df, len(records), signature)
+            return len(delta_ids)
+
+    def _read_file(self):
+        """Read the raw dataset file"""
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def _publish(self, header, records, df, row_count, signature):
+        """Swap in a new snapshot"""
+        version = self._snapshot[2] + 1 if self._snapshot else 0
+        self._header = header
+        self._records = records
+        self._signature = signature
+        self._snapshot = (df, row_count, version)
+
+        for callback in list(self._listeners):
+            try:
+                callback(self._snapshot)
+            except Exception:
+                logger.exception("Snapshot listener failed")
+
+    def _file_signature(self):
+        """Cheap fingerprint used to detect that the file was rewritten"""
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+
+class DatasetWatcher(threading.Thread):
+    """Polls the dataset file and triggers a delta refresh when it changes"""
+
+    def __init__(self, store, interval=5.0):
+        super().__init__(name="dataset-watcher", daemon=True)
+        # Only a weak reference, so the watcher stops once the store is dropped
+        # (e.g. when the Streamlit resource cache is cleared)
+        self._store = weakref.ref(store)
+        self.path = store.path
+        self.interval = interval
+        self._stopped = threading.Event()
+        weakref.finalize(store, self._stopped.set)
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            store = self._store()
+            if store is None:
+                break
+            try:
+                updated = store.refresh()
+                if updated:
+                    logger.info("Ingested %d new or changed rows from %s", updated, self.path)
+            except Exception:
+                # A half-written export must not kill the watcher
+                logger.exception("Failed to refresh dataset from %s", self.path)
+            finally:
+                del store
+
+    def stop(self):
+        """Stop polling"""
+        self._stopped.set()
+
+
+@st.cache_resource(show_spinner=False)
+def get_data_store(path, watch_interval=5.0):
+    """
+    Return the process-wide store for a dataset file, starting its watcher
+
+    Args:
+        path (str): Location of the dataset CSV
+        watch_interval (float): Seconds between file checks, 0 disables watching
+
+    Returns:
+        DataStore: Shared store
+    """
+    store = DataStore(path)
+    if watch_interval:
+        DatasetWatcher(store, watch_interval).start()
+    return store
@@ -6,6 +6,69 @@ import streamlit as st
 import numpy as np
 
 
+def filter_netflix(df, selection):
+    """
+    Filter a Netflix dataframe by a selection of filter values
+    
+    Args:
+        df (DataFrame): Netflix dataset
+        selection (dict): Optional 'types', 'ratings' and 'year_range' entries,
+            a missing entry leaves that column unfiltered
+    
+    Returns:
+        DataFrame: Filtered dataset
+    """
+    if 'types' in selection:
+        df = df[df['type'].isin(selection['types'])]
+    
+    if 'ratings' in selection and 'rating' in df.columns:
+        df = df[df['rating'].isin(selection['ratings'])]
+    
+    if 'year_range' in selection and 'release_year' in df.columns:
+        year_range = selection['year_range']
+        df = df[
+            (df['release_year'] >= year_range[0]) &
+            (df['release_year'] <= year_range[1])
+        ]
+    
+    return df
+
+
+def default_netflix_selection(df):
+    """
+    Selection matching the sidebar defaults: all types, all ratings, full year range
+    
+    Args:
+        df (DataFrame): Netflix dataset
+    
+    Returns:
+        dict: Selection accepted by filter_netflix()
+    """
+    selection = {'types': df['type'].unique().tolist()}
+    if 'rating' in df.columns:
+        selection['ratings'] = sorted(df['rating'].dropna().unique().tolist())
+    if 'release_year' in df.columns:
+        selection['year_range'] = (int(df['release_year'].min()), int(df['release_year'].max()))
+    return selection
+
+
+def selection_key(selection):
+    """
+    Normalise a selection into a hashable key
+    
+    Args:
+        selection (dict): Selection accepted by filter_netflix()
+    
+    Returns:
+        tuple: Order-independent key
+    """
+    return (
+        tuple(sorted(selection['types'])) if 'types' in selection else None,
+        tuple(sorted(selection['ratings'])) if 'ratings' in selection else None,
+        tuple(selection['year_range']) if 'year_range' in selection else None,
+    )
+
+
 class FilterManager:
     """Manages filters for different dataset types"""
     
@@ -13,6 +76,17 @@ class FilterManager:
         self.df = df
         self.dataset_type = dataset_type
         self.filtered_df = df.copy()
+        # Widget values behind the current filtered view, see selection_key()
+        self.selection = {}
+    
+    def selection_key(self):
+        """
+        Hashable key for the current filter selection
+        
+        Returns:
+            tuple: Normalised selection, usable as a cache key
+        """
+        return selection_key(self.selection)
     
     def apply_filters(self):
         """
@@ -37,7 +111,7 @@ class FilterManager:
             options=self.df['type'].unique().tolist(),
             default=self.df['type'].unique().tolist()
         )
-        self.filtered_df = self.filtered_df[self.filtered_df['type'].isin(type_options)]
+        self.selection['types'] = type_options
         
         # Rating filter
         if 'rating' in self.df.columns:
@@ -47,7 +121,7 @@ class FilterManager:
                 options=all_ratings,
                 default=all_ratings  # Include ALL ratings by default
             )
-            self.filtered_df = self.filtered_df[self.filtered_df['rating'].isin(rating_options)]
+            self.selection['ratings'] = rating_options
         
         # Release year range slider
         if 'release_year' in self.df.columns:
@@ -59,11 +133,9 @@ class FilterManager:
                 max_year,
                 (min_year, max_year)
             )
-            self.filtered_df = self.filtered_df[
-                (self.filtered_df['release_year'] >= year_range[0]) &
-                (self.filtered_df['release_year'] <= year_range[1])
-            ]
+            self.selection['year_range'] = year_range
         
+        self.filtered_df = filter_netflix(self.filtered_df, self.selection)
         return self.filtered_df
     
     def _apply_custom_filters(self):
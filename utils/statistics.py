@@ -9,9 +9,28 @@ import numpy as np
 class StatisticsManager:
     """Manages statistical summaries and metrics for datasets"""
     
-    def __init__(self, df, dataset_type):
+    def __init__(self, df, dataset_type, artifacts=None):
         self.df = df
         self.dataset_type = dataset_type
+        # Prebuilt aggregates, shared with the warm-up cache
+        self.artifacts = artifacts if artifacts is not None else {}
+    
+    def build_artifacts(self):
+        """
+        Build the summary aggregates up front
+        
+        Returns:
+            dict: The artifacts, also kept on this manager
+        """
+        self._artifact('numerical_summary', self._build_numerical_summary)
+        self._artifact('categorical_summary', self._build_categorical_summary)
+        return self.artifacts
+    
+    def _artifact(self, name, builder):
+        """Return a prebuilt artifact, building and keeping it if missing"""
+        if name not in self.artifacts:
+            self.artifacts[name] = builder()
+        return self.artifacts[name]
     
     def display_top_metrics(self):
         """Display key metrics based on dataset type"""
@@ -56,22 +75,34 @@ class StatisticsManager:
     def _display_numerical_summary(self):
         """Display numerical statistics summary"""
         st.subheader("📈 Numerical Summary")
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        summary = self._artifact('numerical_summary', self._build_numerical_summary)
         
-        if len(numeric_cols) > 0:
-            st.dataframe(self.df[numeric_cols].describe(), use_container_width=True)
+        if summary is not None:
+            st.dataframe(summary, use_container_width=True)
         else:
             st.info("No numerical columns available")
     
+    def _build_numerical_summary(self):
+        """Describe the numeric columns, or None if there are none"""
+        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        
+        if len(numeric_cols) > 0:
+            return self.df[numeric_cols].describe()
+        return None
+    
     def _display_categorical_summary(self):
         """Display categorical statistics summary"""
         st.subheader("🏷️ Categorical Summary")
-        categorical_cols = self.df.select_dtypes(include=['object']).columns
+        summary = self._artifact('categorical_summary', self._build_categorical_summary)
         
-        if len(categorical_cols) > 0:
-            for col in categorical_cols[:3]:  # Show first 3 categorical columns
+        if summary:
+            for col, value_counts in summary:
                 st.write(f"**{col}:**")
-                value_counts = self.df[col].value_counts().head(10)
                 st.dataframe(value_counts, use_container_width=True)
         else:
             st.info("No categorical columns available")
+    
+    def _build_categorical_summary(self):
+        """Top 10 value counts for the first 3 categorical columns"""
+        categorical_cols = self.df.select_dtypes(include=['object']).columns
+        return [(col, self.df[col].value_counts().head(10)) for col in categorical_cols[:3]]
@@ -2,16 +2,50 @@
 Visualization module for creating interactive charts and plots
 """
 
+import threading
 import streamlit as st
 import plotly.express as px
 
 
+# plotly.express lazily fills in shared template state while building a figure,
+# so the px/layout calls (not the data aggregation) run one at a time
+_FIGURE_LOCK = threading.Lock()
+
+
 class VisualizationManager:
     """Manages visualizations for different dataset types"""
     
-    def __init__(self, df, dataset_type):
+    def __init__(self, df, dataset_type, artifacts=None):
         self.df = df
         self.dataset_type = dataset_type
+        # Prebuilt figures and exports, shared with the warm-up cache
+        self.artifacts = artifacts if artifacts is not None else {}
+    
+    def build_artifacts(self):
+        """
+        Build every Netflix figure, aggregate and the CSV export up front
+        
+        Used by the warm-up; selections first built by a session cache their
+        figures but not the CSV export.
+        
+        Returns:
+            dict: The artifacts, also kept on this manager
+        """
+        if self.dataset_type == "netflix":
+            self._artifact('type_chart', self._build_netflix_type_chart)
+            self._artifact('year_chart', self._build_netflix_year_chart)
+            if 'listed_in' in self.df.columns:
+                self._artifact('genre_pie', self._build_netflix_genre_pie)
+            if 'country' in self.df.columns:
+                self._artifact('country_map', self._build_netflix_country_map)
+        self._artifact('csv', self._build_csv)
+        return self.artifacts
+    
+    def _artifact(self, name, builder):
+        """Return a prebuilt artifact, building and keeping it if missing"""
+        if name not in self.artifacts:
+            self.artifacts[name] = builder()
+        return self.artifacts[name]
     
     def display_visualizations(self):
         """Display visualizations in tabbed interface"""
@@ -65,8 +99,11 @@ class VisualizationManager:
         st.subheader("📋 Filtered Data Preview")
         st.dataframe(self.df.head(100), use_container_width=True)
         
-        # Download button
-        csv = self.df.to_csv(index=False)
+        # Download button - only warmed selections keep their export cached,
+        # since it is by far the largest artifact
+        csv = self.artifacts.get('csv')
+        if csv is None:
+            csv = self._build_csv()
         st.download_button(
             label="⬇️ Download Filtered Data as CSV",
             data=csv,
@@ -74,68 +111,89 @@ class VisualizationManager:
             mime="text/csv"
         )
     
+    def _build_csv(self):
+        """Export the filtered data as CSV text"""
+        return self.df.to_csv(index=False)
+    
     # Netflix visualizations
     def _create_netflix_type_chart(self):
         """Create bar chart for Netflix content types"""
+        st.plotly_chart(self._artifact('type_chart', self._build_netflix_type_chart), use_container_width=True)
+    
+    def _build_netflix_type_chart(self):
+        """Build bar chart figure for Netflix content types"""
         type_counts = self.df['type'].value_counts().reset_index()
         type_counts.columns = ['type', 'count']
         
-        fig = px.bar(
-            type_counts,
-            x='type',
-            y='count',
-            title="Netflix Content Distribution: Movies vs TV Shows",
-            labels={'type': 'Content Type', 'count': 'Number of Titles'},
-            template="plotly_dark",
-            color='type',
-            color_discrete_map={'Movie': '#E50914', 'TV Show': '#B20710'}
-        )
-        fig.update_layout(
-            height=500,
-            paper_bgcolor='#141414',
-            plot_bgcolor='#1f1f1f',
-            font=dict(color='white'),
-            title_font=dict(size=20, color='#E50914')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        with _FIGURE_LOCK:
+            fig = px.bar(
+                type_counts,
+                x='type',
+                y='count',
+                title="Netflix Content Distribution: Movies vs TV Shows",
+                labels={'type': 'Content Type', 'count': 'Number of Titles'},
+                template="plotly_dark",
+                color='type',
+                color_discrete_map={'Movie': '#E50914', 'TV Show': '#B20710'}
+            )
+            fig.update_layout(
+                height=500,
+                paper_bgcolor='#141414',
+                plot_bgcolor='#1f1f1f',
+                font=dict(color='white'),
+                title_font=dict(size=20, color='#E50914')
+            )
+        return fig
     
     def _create_netflix_year_chart(self):
         """Create histogram for Netflix release years"""
-        fig = px.histogram(
-            self.df,
-            x='release_year',
-            color='type',
-            title="Content Release Years Distribution",
-            labels={'release_year': 'Release Year', 'count': 'Number of Titles'},
-            template="plotly_dark",
-            nbins=30,
-            color_discrete_map={'Movie': '#E50914', 'TV Show': '#B20710'}
-        )
-        fig.update_layout(
-            height=500,
-            paper_bgcolor='#141414',
-            plot_bgcolor='#1f1f1f',
-            font=dict(color='white'),
-            title_font=dict(size=20, color='#E50914')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(self._artifact('year_chart', self._build_netflix_year_chart), use_container_width=True)
+    
+    def _build_netflix_year_chart(self):
+        """Build histogram figure for Netflix release years"""
+        with _FIGURE_LOCK:
+            fig = px.histogram(
+                self.df,
+                x='release_year',
+                color='type',
+                title="Content Release Years Distribution",
+                labels={'release_year': 'Release Year', 'count': 'Number of Titles'},
+                template="plotly_dark",
+                nbins=30,
+                color_discrete_map={'Movie': '#E50914', 'TV Show': '#B20710'}
+            )
+            fig.update_layout(
+                height=500,
+                paper_bgcolor='#141414',
+                plot_bgcolor='#1f1f1f',
+                font=dict(color='white'),
+                title_font=dict(size=20, color='#E50914')
+            )
+        return fig
     
     def _create_netflix_genre_pie(self):
         """Create pie chart for Netflix genres distribution"""
         if 'listed_in' in self.df.columns:
-            # Split genres (they're comma-separated) and count them
-            import pandas as pd
-            
-            # Split the listed_in column and flatten into individual genres
-            all_genres = []
-            for genres in self.df['listed_in'].dropna():
-                # Split by comma and strip whitespace
-                genre_list = [g.strip() for g in str(genres).split(',')]
-                all_genres.extend(genre_list)
-            
-            # Count genre occurrences
-            genre_counts = pd.Series(all_genres).value_counts().head(10)
-            
+            st.plotly_chart(self._artifact('genre_pie', self._build_netflix_genre_pie), use_container_width=True)
+        else:
+            st.info("Genre (listed_in) column not available for pie chart")
+    
+    def _build_netflix_genre_pie(self):
+        """Build pie chart figure for Netflix genres distribution"""
+        # Split genres (they're comma-separated) and count them
+        import pandas as pd
+        
+        # Split the listed_in column and flatten into individual genres
+        all_genres = []
+        for genres in self.df['listed_in'].dropna():
+            # Split by comma and strip whitespace
+            genre_list = [g.strip() for g in str(genres).split(',')]
+            all_genres.extend(genre_list)
+        
+        # Count genre occurrences
+        genre_counts = pd.Series(all_genres).value_counts().head(10)
+        
+        with _FIGURE_LOCK:
             fig = px.pie(
                 values=genre_counts.values,
                 names=genre_counts.index,
@@ -150,30 +208,46 @@ class VisualizationManager:
                 title_font=dict(size=20, color='#E50914')
             )
             fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Genre (listed_in) column not available for pie chart")
+        return fig
     
     def _create_netflix_country_map(self):
         """Create world map visualization for Netflix content by country"""
         if 'country' in self.df.columns:
-            import pandas as pd
+            fig, top_countries = self._artifact('country_map', self._build_netflix_country_map)
             
-            # Count content by country (handling multiple countries per title)
-            country_counts = {}
-            
-            for countries in self.df['country'].dropna():
-                # Split by comma and strip whitespace
-                country_list = [c.strip() for c in str(countries).split(',')]
-                for country in country_list:
-                    if country:
-                        country_counts[country] = country_counts.get(country, 0) + 1
-            
-            # Create dataframe for map
-            map_df = pd.DataFrame(list(country_counts.items()), columns=['country', 'count'])
-            map_df = map_df.sort_values('count', ascending=False)
+            st.plotly_chart(fig, use_container_width=True)
             
-            # Create choropleth map
+            # Show top 10 countries table
+            st.subheader("Top 10 Countries by Content Count")
+            st.dataframe(top_countries, use_container_width=True, hide_index=True)
+        else:
+            st.info("Country column not available for map visualization")
+    
+    def _build_netflix_country_map(self):
+        """
+        Build world map figure for Netflix content by country
+        
+        Returns:
+            tuple: (figure, top 10 countries dataframe)
+        """
+        import pandas as pd
+        
+        # Count content by country (handling multiple countries per title)
+        country_counts = {}
+        
+        for countries in self.df['country'].dropna():
+            # Split by comma and strip whitespace
+            country_list = [c.strip() for c in str(countries).split(',')]
+            for country in country_list:
+                if country:
+                    country_counts[country] = country_counts.get(country, 0) + 1
+        
+        # Create dataframe for map
+        map_df = pd.DataFrame(list(country_counts.items()), columns=['country', 'count'])
+        map_df = map_df.sort_values('count', ascending=False)
+        
+        # Create choropleth map
+        with _FIGURE_LOCK:
             fig = px.choropleth(
                 map_df,
                 locations='country',
@@ -185,7 +259,7 @@ class VisualizationManager:
                 color_continuous_scale='Reds',
                 labels={'count': 'Number of Titles'}
             )
-            
+        
             fig.update_layout(
                 height=600,
                 paper_bgcolor='#141414',
@@ -199,15 +273,8 @@ class VisualizationManager:
                 font=dict(color='white'),
                 title_font=dict(size=20, color='#E50914')
             )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Show top 10 countries table
-            st.subheader("Top 10 Countries by Content Count")
-            top_countries = map_df.head(10)
-            st.dataframe(top_countries, use_container_width=True, hide_index=True)
-        else:
-            st.info("Country column not available for map visualization")
+        
+        return fig, map_df.head(10)
     
     # Generic visualizations for custom datasets
     def _create_generic_chart(self):
@@ -215,21 +282,22 @@ class VisualizationManager:
         numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
         
         if len(numeric_cols) >= 2:
-            fig = px.scatter(
-                self.df,
-                x=numeric_cols[0],
-                y=numeric_cols[1],
-                title=f"{numeric_cols[1]} vs {numeric_cols[0]}",
-                template="plotly_dark",
-                color_discrete_sequence=['#E50914']
-            )
-            fig.update_layout(
-                height=500,
-                paper_bgcolor='#141414',
-                plot_bgcolor='#1f1f1f',
-                font=dict(color='white'),
-                title_font=dict(size=20, color='#E50914')
-            )
+            with _FIGURE_LOCK:
+                fig = px.scatter(
+                    self.df,
+                    x=numeric_cols[0],
+                    y=numeric_cols[1],
+                    title=f"{numeric_cols[1]} vs {numeric_cols[0]}",
+                    template="plotly_dark",
+                    color_discrete_sequence=['#E50914']
+                )
+                fig.update_layout(
+                    height=500,
+                    paper_bgcolor='#141414',
+                    plot_bgcolor='#1f1f1f',
+                    font=dict(color='white'),
+                    title_font=dict(size=20, color='#E50914')
+                )
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Not enough numerical columns for visualization")
@@ -239,20 +307,21 @@ class VisualizationManager:
         numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
         
         if len(numeric_cols) >= 1:
-            fig = px.histogram(
-                self.df,
-                x=numeric_cols[0],
-                title=f"Distribution of {numeric_cols[0]}",
-                template="plotly_dark",
-                color_discrete_sequence=['#E50914']
-            )
-            fig.update_layout(
-                height=500,
-                paper_bgcolor='#141414',
-                plot_bgcolor='#1f1f1f',
-                font=dict(color='white'),
-                title_font=dict(size=20, color='#E50914')
-            )
+            with _FIGURE_LOCK:
+                fig = px.histogram(
+                    self.df,
+                    x=numeric_cols[0],
+                    title=f"Distribution of {numeric_cols[0]}",
+                    template="plotly_dark",
+                    color_discrete_sequence=['#E50914']
+                )
+                fig.update_layout(
+                    height=500,
+                    paper_bgcolor='#141414',
+                    plot_bgcolor='#1f1f1f',
+                    font=dict(color='white'),
+                    title_font=dict(size=20, color='#E50914')
+                )
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No numerical columns available for histogram")
@@ -265,20 +334,21 @@ class VisualizationManager:
             col = categorical_cols[0]
             value_counts = self.df[col].value_counts().head(10)
             
-            fig = px.pie(
-                values=value_counts.values,
-                names=value_counts.index,
-                title=f"Distribution of {col} (Top 10)",
-                template="plotly_dark",
-                color_discrete_sequence=px.colors.sequential.Reds_r
-            )
-            fig.update_layout(
-                height=500,
-                paper_bgcolor='#141414',
-                font=dict(color='white'),
-                title_font=dict(size=20, color='#E50914')
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
+            with _FIGURE_LOCK:
+                fig = px.pie(
+                    values=value_counts.values,
+                    names=value_counts.index,
+                    title=f"Distribution of {col} (Top 10)",
+                    template="plotly_dark",
+                    color_discrete_sequence=px.colors.sequential.Reds_r
+                )
+                fig.update_layout(
+                    height=500,
+                    paper_bgcolor='#141414',
+                    font=dict(color='white'),
+                    title_font=dict(size=20, color='#E50914')
+                )
+                fig.update_traces(textposition='inside', textinfo='percent+label')
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No categorical columns available for pie chart")
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""
+Warm-up module for prebuilding the dataset, figures and aggregates at server start
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import streamlit as st
+
+from .config import WARMUP_SELECTIONS, WARMUP_WORKERS, ARTIFACT_CACHE_SIZE
+from .data_loader import find_dataset_path
+from .data_store import get_data_store
+from .filters import filter_netflix, default_netflix_selection, selection_key
+from .statistics import StatisticsManager
+from .visualizations import VisualizationManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactCache:
+    """Keeps prebuilt figures and aggregates for recently used filter selections"""
+
+    def __init__(self, max_entries=ARTIFACT_CACHE_SIZE):
+        self.max_entries = max_entries
+        # Newest snapshot version seen; entries for older ones are dropped
+        self.version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version, key):
+        """
+        Return the artifacts dict for a snapshot version and selection key
+
+        The dict is created empty on a miss; the managers fill it lazily, so
+        whoever renders a selection first builds it for everyone after. A
+        newer version drops every entry of the older ones, and a request for
+        an older version gets a throwaway dict.
+
+        Args:
+            version (int): Dataset snapshot version
+            key (tuple): Selection key from selection_key()
+
+        Returns:
+            dict: Shared artifacts
+        """
+        with self._lock:
+            if self.version is None or version > self.version:
+                self._entries.clear()
+                self.version = version
+            elif version < self.version:
+                return {}
+            
+            entry_key = (version, key)
+            if entry_key in self._entries:
+                self._entries.move_to_end(entry_key)
+            else:
+                self._entries[entry_key] = {}
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return self._entries[entry_key]
+
+
+def prebuild_artifacts(df, version, selection, cache):
+    """
+    Build every figure and aggregate the dashboard shows for one selection
+
+    Args:
+        df (DataFrame): Netflix dataset snapshot
+        version (int): Snapshot version of df
+        selection (dict): Selection accepted by filter_netflix()
+        cache (ArtifactCache): Cache receiving the artifacts
+    """
+    artifacts = cache.get(version, selection_key(selection))
+    filtered_df = filter_netflix(df, selection)
+    StatisticsManager(filtered_df, "netflix", artifacts).build_artifacts()
+    VisualizationManager(filtered_df, "netflix", artifacts).build_artifacts()
+
+
+class WarmupManager:
+    """Runs the optional warm-up phase on a thread pool and tracks readiness"""
+
+    def __init__(self, cache, selections=WARMUP_SELECTIONS, max_workers=WARMUP_WORKERS):
+        self.cache = cache
+        self.selections = selections
+        self.max_workers = max_workers
+        self.state = "idle"
+        self.completed = 0
+        self.total = 0
+        self.elapsed = None
+        self.error = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._warm_lock = threading.Lock()
+
+    def start(self):
+        """
+        Start warming up in the background; later calls do nothing
+
+        Once started, every snapshot the data store publishes afterwards (e.g.
+        after a delta ingestion) is warmed again.
+        """
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self.state = "running"
+            self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+            self._thread.start()
+
+    def is_ready(self):
+        """Whether the warm-up finished successfully"""
+        return self.state == "ready"
+
+    def wait(self, timeout=None):
+        """
+        Block until the warm-up finishes
+
+        Returns:
+            bool: True if it finished successfully
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.is_ready()
+
+    def status(self):
+        """
+        Describe warm-up progress
+
+        Returns:
+            str: Human readable status
+        """
+        if self.state == "running":
+            return f"Warming up... {self.completed}/{self.total or '?'} selections"
+        if self.state == "ready":
+            return f"Warm-up complete: {self.completed} selections in {self.elapsed:.1f}s"
+        if self.state == "failed":
+            return f"Warm-up failed: {self.error}"
+        return "Warm-up not started"
+
+    def _run(self):
+        """Load the dataset, warm its snapshot and follow later snapshots"""
+        try:
+            path = find_dataset_path()
+            if path is None:
+                raise FileNotFoundError("netflix_titles.csv not found")
+
+            # A single parse - the pool is for the per-selection builds
+            store = get_data_store(path)
+        except Exception as e:
+            self.error = str(e)
+            self.state = "failed"
+            logger.exception("Warm-up failed")
+            return
+
+        store.add_listener(self._on_snapshot)
+        self._warm(store.snapshot())
+
+    def _on_snapshot(self, snapshot):
+        """Re-warm a newly published snapshot without blocking the publisher"""
+        threading.Thread(target=self._warm, args=(snapshot,), name="warmup", daemon=True).start()
+
+    def _warm(self, snapshot):
+        """Prebuild the default and configured selections on the thread pool"""
+        with self._warm_lock:
+            df, _, version = snapshot
+            if self.cache.version is not None and version < self.cache.version:
+                # A newer snapshot was published meanwhile and is warmed next
+                return
+
+            started = time.perf_counter()
+            self.state = "running"
+            self.completed = 0
+            try:
+                default = default_netflix_selection(df)
+                selections = [default] + [{**default, **selection} for selection in self.selections]
+                self.total = len(selections)
+
+                with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="warmup") as pool:
+                    futures = [
+                        pool.submit(prebuild_artifacts, df, version, selection, self.cache)
+                        for selection in selections
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+                        self.completed += 1
+
+                self.elapsed = time.perf_counter() - started
+                self.state = "ready"
+                logger.info(self.status())
+            except Exception as e:
+                self.error = str(e)
+                self.state = "failed"
+                logger.exception("Warm-up failed")
+
+
+@st.cache_resource(show_spinner=False)
+def get_artifact_cache():
+    """Return the process-wide artifact cache"""
+    return ArtifactCache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_warmup_manager():
+    """Return the process-wide warm-up manager"""
+    return WarmupManager(get_artifact_cache())